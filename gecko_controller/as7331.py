@@ -1,4 +1,5 @@
 import asyncio
+import struct
 import time
 import smbus
 from adafruit_bus_device.i2c_device import I2CDevice
@@ -212,6 +213,14 @@ class AS7331:
             print(f"I2C read error: {e}")
             return 0, 0
 
+    def read_block(self, reg, length):
+        """Reads length bytes starting at the specified register"""
+        try:
+            return bytes(self.bus.read_i2c_block_data(self.address, reg, length))
+        except OSError as e:
+            print(f"I2C read error: {e}")
+            return bytes(length)
+
     def write_uint16(self, reg, lo_byte, hi_byte):
         """Writes two bytes (uint16) to the specified register"""
         try:
@@ -365,6 +374,15 @@ class AS7331:
     def mres3_as_uint16(self):
         return bytes_to_uint16(*self.mres3)
 
+    @property
+    def results_as_uint16(self):
+        """
+        Reads TEMP, MRES1, MRES2 and MRES3 in one 8-byte block transfer.
+        The output registers are consecutive, so this replaces four separate
+        reads. Returns (temp, uva, uvb, uvc) as uint16 values.
+        """
+        return struct.unpack('<4H', self.read_block(_REG_ADDR_TEMP, 8))
+
     @property
     def power_down_enabled(self):
         """ Reads the power down state of the device True/False via the OSR """
@@ -756,10 +774,10 @@ class AS7331:
             pass
 
         div_factor = self.divider_factor
-        uva_raw = self.mres1_as_uint16*div_factor
-        uvb_raw = self.mres2_as_uint16*div_factor
-        uvc_raw = self.mres3_as_uint16*div_factor
-        temp_raw = self.temp_as_uint16
+        temp_raw, mres1, mres2, mres3 = self.results_as_uint16
+        uva_raw = mres1*div_factor
+        uvb_raw = mres2*div_factor
+        uvc_raw = mres3*div_factor
 
         if self.overflow_exception:
             if self.status_as_dict['mresof']:
@@ -785,49 +803,47 @@ class AS7331:
 
     async def async_get_values(self):
         """Async version of reading values"""
-        try:
-            # Get conversion factors
-            common_factor = self.conversion_factor
-            conv_factor_a = _FSRA*common_factor
-            conv_factor_b = _FSRB*common_factor
-            conv_factor_c = _FSRC*common_factor
-
-            # In continuous mode, don't start measurement - just read values
-            if self.measurement_mode == MEASUREMENT_MODE_CONTINUOUS:
-                # Small delay to ensure we have fresh data
-                await asyncio.sleep(self.measurement_sleep_dt)
-            else:
-                # For command mode, start measurement and wait for ready
-                self.start_measurement()
-                timeout = self.measurement_sleep_dt * 2
-                start_time = time.time()
-
-                while self.notready:
-                    await asyncio.sleep(0.01)
-                    if time.time() - start_time > timeout:
-                        raise TimeoutError("UV sensor measurement timeout")
-
-            # Get raw values
-            div_factor = self.divider_factor
-            uva_raw = self.mres1_as_uint16 * div_factor
-            uvb_raw = self.mres2_as_uint16 * div_factor
-            uvc_raw = self.mres3_as_uint16 * div_factor
-            temp_raw = self.temp_as_uint16
-
-            if self.overflow_exception:
-                if self.status_as_dict['mresof']:
-                    raise AS7331Overflow("measurement register overflow")
-
-            # Convert to uW/cm**2 or deg C
-            uva = uva_raw * conv_factor_a
-            uvb = uvb_raw * conv_factor_b
-            uvc = uvc_raw * conv_factor_c
-            temp = temp_raw_to_celsius(temp_raw)
-
-            return uva, uvb, uvc, temp
-
-        except Exception as e:
-            raise Exception(f"Error reading UV values: {str(e)}") from e
+        # Get conversion factors
+        common_factor = self.conversion_factor
+        conv_factor_a = _FSRA*common_factor
+        conv_factor_b = _FSRB*common_factor
+        conv_factor_c = _FSRC*common_factor
+
+        # In continuous mode, don't start measurement - just read values.
+        # Use the cached mode: reading CREG3 means a round trip through the
+        # configuration state, five transfers per measurement.
+        if self.state_copy['measurement_mode'] == MEASUREMENT_MODE_CONTINUOUS:
+            # Small delay to ensure we have fresh data
+            await asyncio.sleep(self.measurement_sleep_dt)
+        else:
+            # For command mode, start measurement and wait for ready
+            self.start_measurement()
+            timeout = self.measurement_sleep_dt * 2
+            start_time = time.time()
+
+            while self.notready:
+                await asyncio.sleep(0.01)
+                if time.time() - start_time > timeout:
+                    raise TimeoutError("UV sensor measurement timeout")
+
+        # Get raw values
+        div_factor = self.divider_factor
+        temp_raw, mres1, mres2, mres3 = self.results_as_uint16
+        uva_raw = mres1 * div_factor
+        uvb_raw = mres2 * div_factor
+        uvc_raw = mres3 * div_factor
+
+        if self.overflow_exception:
+            if self.status_as_dict['mresof']:
+                raise AS7331Overflow("measurement register overflow")
+
+        # Convert to uW/cm**2 or deg C
+        uva = uva_raw * conv_factor_a
+        uvb = uvb_raw * conv_factor_b
+        uvc = uvc_raw * conv_factor_c
+        temp = temp_raw_to_celsius(temp_raw)
+
+        return uva, uvb, uvc, temp
 
 # Exceptions
 # -----------------------------------------------------------------------------
@@ -1,28 +1,25 @@
 #!/usr/bin/env python3
+import array
 import asyncio
 import os
 import sys
 import signal
+import struct
 import time
 import math
-import pwd
-import grp
+import functools
 import smbus2
+from smbus2 import i2c_msg
 import RPi.GPIO as GPIO
 import traceback
 import logging
 import logging.handlers
-from datetime import datetime, timedelta, time as datetime_time
+from datetime import datetime, time as datetime_time
 from PIL import Image, ImageDraw, ImageFont
 import pathlib
-from typing import Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from pathlib import Path
 
-# Add the project root to the Python path
-project_root = str(Path(__file__).resolve().parent.parent.parent)
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
-
 from gecko_controller.ssh1106 import SSH1106Display
 from gecko_controller.display_socket import DisplaySocketServer
 from gecko_controller.config_loader import load_config
@@ -33,19 +30,275 @@ LOG_FILE = "readings.csv"
 MAX_LOG_SIZE = 10 * 1024 * 1024  # 10MB per file
 LOG_BACKUP_COUNT = 5  # Keep 5 rotated files
 LOG_INTERVAL = 60  # seconds
+READINGS_BATCH_SIZE = 16  # Max queued readings written per flush
+READINGS_FLUSH_INTERVAL = 1.0  # seconds to wait for a batch to fill
+
+# Control loop timing
+CONTROL_INTERVAL = 10.0  # seconds between regular iterations
+TRANSITION_WAKE_MARGIN = 0.05  # seconds past a light transition to wake
+UV_READ_INTERVAL = 30.0  # seconds between UV reads; UV only moves with the lamp
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+# Heat control decides on the mean of this many recent temperature readings
+TEMP_SMOOTHING_SAMPLES = 8
+
+# SHT31 temperature/humidity sensor
+SHT31_ADDRESS = 0x44
+SHT31_MEASURE_CMD = [0x24, 0x00]  # Single shot, high repeatability, no clock stretching
+SHT31_CONVERSION_TIME = 0.0155  # seconds - datasheet maximum for high repeatability
+SHT31_POLL_INTERVAL = 0.002  # seconds between reads while the sensor NACKs
+SHT31_READ_TIMEOUT = 0.1  # seconds after the measure command before giving up
+SHT31_READ_LENGTH = 5  # T msb, T lsb, T crc, RH msb, RH lsb - the RH crc is not checked
+SHT31_RESULT = struct.Struct('>HBH')  # Raw temperature, its CRC, raw humidity
+SHT31_TEMP_SCALE = 175.0 / 65535.0
+SHT31_RH_SCALE = 100.0 / 65535.0
+
+# Consecutive sensor failures between repeated error log lines
+SENSOR_ERROR_LOG_EVERY = 8
+# UV sensor re-init is retried after 1, 2, 4, ... failed reads, then every this many
+UV_REINIT_BACKOFF_MAX = 32
+
+# Display geometry
+DISPLAY_WIDTH = 128
+DISPLAY_HEIGHT = 64
+DIRTY_BAND_HEIGHT = 16  # One band per text row
+CLOCK_FORMAT = "{:02d}:{:02d}".format  # Two-field template, cheaper than the f-string
+
+# Corrected UV readings above this are treated as sensor errors
+UV_MAX_CORRECTED = 100000  # μW/cm²
 
 # Get the directory where the module is installed
 MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-# Load config before class definition
-config = load_config()
-if config is None:
-    if __name__ == "__main__":
-        sys.exit(1)
-    else:
-        raise ImportError("No configuration found")
+@functools.lru_cache(maxsize=8)
+def angle_cos_sin(degrees: float) -> Tuple[float, float]:
+    """Cosine and sine of an angle in degrees, cached as sensor angles rarely change"""
+    radians = math.radians(degrees)
+    return math.cos(radians), math.sin(radians)
+
+ICON_SIZE = 12
+
+def icon_bitmap(*rows: str) -> Image.Image:
+    """Build a 1-bit icon from rows of '#' (ink) and '.' (background)"""
+    raw = b''.join(
+        int(row.replace('#', '1').replace('.', '0'), 2).to_bytes(2, 'big')
+        for row in (row.ljust(16, '.') for row in rows)
+    )
+    # '1;I' treats set bits as black, matching the '#' ink above
+    return Image.frombytes('1', (ICON_SIZE, ICON_SIZE), raw, 'raw', '1;I')
+
+# Hand-drawn 12x12 display icons, so no icon font has to be loaded
+ICONS = {
+    'CLOCK': icon_bitmap(
+        "....####....",
+        "..##....##..",
+        ".#...#....#.",
+        ".#...#....#.",
+        "#....#.....#",
+        "#....####..#",
+        "#..........#",
+        "#..........#",
+        ".#........#.",
+        ".#........#.",
+        "..##....##..",
+        "....####....",
+    ),
+    'HUMIDITY': icon_bitmap(
+        ".....##.....",
+        ".....##.....",
+        "....#..#....",
+        "....#..#....",
+        "...#....#...",
+        "..#......#..",
+        "..#......#..",
+        ".#........#.",
+        ".#.#......#.",
+        ".#..#.....#.",
+        "..#......#..",
+        "...######...",
+    ),
+    'THERMOMETER': icon_bitmap(
+        ".....##.....",
+        "....#..#....",
+        "....#..#....",
+        "....#..#....",
+        "....#..#....",
+        "....####....",
+        "....####....",
+        "...######...",
+        "..########..",
+        "..########..",
+        "...######...",
+        "....####....",
+    ),
+    'TARGET': icon_bitmap(
+        "....####....",
+        "..##....##..",
+        ".#........#.",
+        ".#..####..#.",
+        "#..#....#..#",
+        "#..#.##.#..#",
+        "#..#.##.#..#",
+        "#..#....#..#",
+        ".#..####..#.",
+        ".#........#.",
+        "..##....##..",
+        "....####....",
+    ),
+    'GOOD': icon_bitmap(
+        "....####....",
+        "..##....##..",
+        ".#........#.",
+        ".#..#..#..#.",
+        "#...#..#...#",
+        "#..........#",
+        "#..........#",
+        "#..#....#..#",
+        ".#..####..#.",
+        ".#........#.",
+        "..##....##..",
+        "....####....",
+    ),
+    'TOO_LOW': icon_bitmap(
+        ".....####...",
+        "....###.....",
+        "...###......",
+        "...##.......",
+        "..###.......",
+        "..###.......",
+        "..###.......",
+        "..###.......",
+        "...##.......",
+        "...###......",
+        "....###.....",
+        ".....####...",
+    ),
+    'TOO_HIGH': icon_bitmap(
+        ".....##.....",
+        ".....##.....",
+        "....#..#....",
+        "....#..#....",
+        "...#.##.#...",
+        "...#.##.#...",
+        "..#..##..#..",
+        "..#..##..#..",
+        ".#........#.",
+        ".#...##...#.",
+        "#..........#",
+        "############",
+    ),
+    'ERROR': icon_bitmap(
+        "...#####....",
+        "..##...##...",
+        "..##...##...",
+        ".......##...",
+        "......##....",
+        ".....##.....",
+        "....##......",
+        "....##......",
+        "............",
+        "....##......",
+        "....##......",
+        "............",
+    ),
+}
+
+class BatchedReadingsLog:
+    """Queue preformatted CSV rows and append them to the readings file in batches
+
+    The RotatingFileHandler is only used for its file and rotation handling;
+    rows bypass the logging record/formatter machinery entirely.
+    """
+
+    def __init__(self, handler: logging.handlers.RotatingFileHandler,
+                 logger: Optional[logging.Logger] = None):
+        self.queue = asyncio.Queue()
+        self.handler = handler
+        self.logger = logger or logging.getLogger(__name__)
+
+    def put(self, row: str):
+        """Queue a complete CSV row (including the trailing newline)"""
+        self.queue.put_nowait(row)
+
+    @staticmethod
+    def _reopen(handler: logging.handlers.RotatingFileHandler):
+        """Open the handler's file through the public setStream API"""
+        handler.setStream(open(handler.baseFilename, handler.mode,
+                               encoding=handler.encoding, errors=handler.errors))
+
+    def write_batch(self, rows) -> bool:
+        """Append queued rows, rotating the file first if they would overflow it
+
+        File errors are logged and the batch is dropped, so a full disk or a
+        bad log directory never reaches the caller.
+        """
+        data = ''.join(rows)
+        handler = self.handler
+        handler.acquire()
+        try:
+            if handler.stream is None:
+                self._reopen(handler)
+            if handler.maxBytes > 0:
+                handler.stream.seek(0, 2)
+                if handler.stream.tell() + len(data) >= handler.maxBytes:
+                    handler.doRollover()
+                    # With delay=True the rollover leaves the stream closed
+                    if handler.stream is None:
+                        self._reopen(handler)
+            handler.stream.write(data)
+            handler.stream.flush()
+            return True
+        except OSError as e:
+            self.logger.error(f"Failed to write {len(rows)} readings: {e}")
+            return False
+        finally:
+            handler.release()
 
 class GeckoController:
+    # UV status icons, also the keys of the status icon tiles
+    ICON_GOOD = "☺"
+    ICON_TOO_LOW = "🌜"
+    ICON_TOO_HIGH = "⚠"
+    ICON_ERROR = "?"
+
+    # Icons pasted once into the static layer: (position, ICONS key)
+    STATIC_ICONS = (
+        ((4, 4), 'CLOCK'),
+        ((68, 4), 'HUMIDITY'),
+        ((4, 20), 'THERMOMETER'),
+        ((68, 20), 'TARGET'),
+    )
+
+    # Labels drawn once into the static layer: (position, text)
+    STATIC_LABELS = (
+        ((4, 36), "UVA"),
+        ((68, 36), "UVB"),
+    )
+
+    # Where each dynamic field draws its text or pastes its tile
+    FIELD_ORIGINS = {
+        'time': (20, 4),
+        'humidity': (84, 4),
+        'temp': (20, 20),
+        'target': (84, 20),
+        'uva_icon': (36, 36),
+        'uvb_icon': (100, 36),
+        'status': (4, 52),
+    }
+    SCHEDULE_RIGHT_EDGE = 124  # The schedule text is right-aligned to this x
+
+    # Screen area owned by each dynamic field; cleared back to the static layer on change
+    FIELD_REGIONS = {
+        'time': (20, 0, 68, 16),
+        'humidity': (84, 0, 128, 16),
+        'temp': (20, 16, 68, 32),
+        'target': (84, 16, 128, 32),
+        'uva_icon': (36, 32, 68, 48),
+        'uvb_icon': (100, 32, 128, 48),
+        'status': (0, 48, 128, 64),
+    }
+
     def __init__(self, test_mode=False):
         self.test_mode = test_mode
 
@@ -55,9 +308,14 @@ class GeckoController:
         # Set up logging first thing
         self.setup_logging()
 
+        # Load config after logging is set up so we can log any issues
+        self.config = load_config()
+
+        # Last state written to each relay; None means unknown
+        self._light_state = None
+        self._heat_state = False
+
         if not self.test_mode:
-            # Load config after logging is set up so we can log any issues
-            self.config = config
             if self.config is None:
                 self.logger.error("No configuration found")
                 raise ImportError("No configuration found")
@@ -69,33 +327,83 @@ class GeckoController:
             self.setup_uv_sensor()
 
             # Initialize display buffer
-            self.image = Image.new('1', (128, 64), 255)
+            self.image = Image.new('1', (DISPLAY_WIDTH, DISPLAY_HEIGHT), 255)
             self.draw = ImageDraw.Draw(self.image)
             self.regular_font = self.load_font("DejaVuSans.ttf", 10)
-            self.icon_font = self.load_font("Symbola_hint.ttf", 12)
 
             # Initialize controller state
             self.light_on_time = self.parse_time_setting(self.config.LIGHT_ON_TIME)
             self.light_off_time = self.parse_time_setting(self.config.LIGHT_OFF_TIME)
+            self._light_on_second = self.light_on_time.hour * 3600 + self.light_on_time.minute * 60
+            self._light_off_second = self.light_off_time.hour * 3600 + self.light_off_time.minute * 60
             self.UVA_THRESHOLDS = self.config.UVA_THRESHOLDS
             self.UVB_THRESHOLDS = self.config.UVB_THRESHOLDS
+            # Flattened copies for the per-tick icon checks
+            self._uva_low = self.UVA_THRESHOLDS['low']
+            self._uva_high = self.UVA_THRESHOLDS['high']
+            self._uvb_low = self.UVB_THRESHOLDS['low']
+            self._uvb_high = self.UVB_THRESHOLDS['high']
             self.uv_correction_factor = self.calculate_uv_correction()
 
-            # Set UI icons
-            self.ICON_CLOCK = "⏲"
-            self.ICON_HUMIDITY = "🌢"
-            self.ICON_THERMOMETER = "🌡"
-            self.ICON_TARGET = "🞋"
-            self.ICON_GOOD = "☺"
-            self.ICON_TOO_LOW = "🌜"
-            self.ICON_TOO_HIGH = "⚠"
-            self.ICON_ERROR = "?"
-
-        self.last_log_time = 0
+            # Render the parts of the screen that never change once
+            self._static_image = self.render_static_layer()
+            self._icon_tiles = {
+                self.ICON_GOOD: ICONS['GOOD'],
+                self.ICON_TOO_LOW: ICONS['TOO_LOW'],
+                self.ICON_TOO_HIGH: ICONS['TOO_HIGH'],
+                self.ICON_ERROR: ICONS['ERROR'],
+            }
+            self._status_tiles = self.render_status_tiles()
+            self._static_crops = {
+                name: self._static_image.crop(box) for name, box in self.FIELD_REGIONS.items()
+            }
+            self.image.paste(self._static_image)
+            self._field_values = {}
+            # Packed 1-bit copy of the last frame, reused for diffing and the socket
+            self._frame_buf = bytearray(DISPLAY_WIDTH * DISPLAY_HEIGHT // 8)
+            self._frame_valid = False
+
+        # Monotonic clock can be small right after boot, so start from -inf
+        self.last_log_time = float('-inf')
         self.display_socket = None
 
+        # Schedule results only change on minute boundaries
+        self._sched_cache = None
+        self._light_period_cache = None
+
+        # Monotonic start time of an SHT31 conversion that has not been read yet
+        self._temp_pending_since = None
+
+        # SHT31 transfers are fixed, so build the I2C messages once and
+        # reuse them for every read
+        self._sht_measure_msg = i2c_msg.write(SHT31_ADDRESS, SHT31_MEASURE_CMD)
+        self._sht_read_msg = i2c_msg.read(SHT31_ADDRESS, SHT31_READ_LENGTH)
+
+        # Set to cut the control loop's sleep short
+        self._wake_event = asyncio.Event()
+
+        # Consecutive failed reads per sensor, used to throttle error logging
+        self._error_streaks = {}
+
+        # Latest UV reading published by uv_reader, and the event that asks
+        # it for a fresh one
+        self._last_uv = (None, None, None)
+        self._uv_wake = asyncio.Event()
+        # Set once uv_reader has finished its first read attempt
+        self._uv_ready = asyncio.Event()
+
+        # Ring of recent temperatures for heat control, preallocated and unboxed
+        self._temp_ring = array.array('d', [0.0] * TEMP_SMOOTHING_SAMPLES)
+        self._temp_ring_index = 0
+        self._temp_ring_count = 0
+
+        # Everything the display shows, at display precision, as of the last redraw
+        self._last_display_key = None
+
     def setup_logging(self):
         """Configure logging with rotation and readings log"""
+        log_dir = Path(LOG_DIR)
+
         # Main logger
         logger = logging.getLogger('gecko_controller')
         if not logger.handlers:
@@ -108,7 +416,7 @@ class GeckoController:
             logger.addHandler(ch)
 
             # File handler
-            log_file = Path(LOG_DIR) / "controller.log"
+            log_file = log_dir / "controller.log"
             fh = logging.handlers.RotatingFileHandler(
                 log_file,
                 maxBytes=MAX_LOG_SIZE,
@@ -119,23 +427,17 @@ class GeckoController:
             ))
             logger.addHandler(fh)
 
-        # Readings logger
-        readings_logger = logging.getLogger('gecko_controller.readings')
-        if not readings_logger.handlers:
-            readings_logger.setLevel(logging.INFO)
-            readings_file = Path(LOG_DIR) / LOG_FILE
-            rh = logging.handlers.RotatingFileHandler(
-                readings_file,
-                maxBytes=MAX_LOG_SIZE,
-                backupCount=LOG_BACKUP_COUNT
-            )
-            rh.setFormatter(logging.Formatter(
-                '%(asctime)s,%(temp).1f,%(humidity).1f,%(uva).4f,%(uvb).4f,%(uvc).4f,%(light)d,%(heat)d'
-            ))
-            readings_logger.addHandler(rh)
+        # Readings log - rows are written directly, the handler only rotates
+        readings_file = log_dir / LOG_FILE
+        rh = logging.handlers.RotatingFileHandler(
+            readings_file,
+            maxBytes=MAX_LOG_SIZE,
+            backupCount=LOG_BACKUP_COUNT,
+            delay=True
+        )
 
         self.logger = logger
-        self.readings_logger = readings_logger
+        self.readings_log = BatchedReadingsLog(rh, logger)
 
     def setup_gpio(self):
         """Set up GPIO with proper error handling"""
@@ -151,6 +453,8 @@ class GeckoController:
             for pin in [self.config.LIGHT_RELAY, self.config.HEAT_RELAY]:
                 GPIO.setup(pin, GPIO.OUT)
                 GPIO.output(pin, GPIO.LOW)  # Initialize to OFF
+            self._light_state = False
+            self._heat_state = False
 
             if hasattr(self.config, 'DISPLAY_RESET'):
                 GPIO.setup(self.config.DISPLAY_RESET, GPIO.OUT)
@@ -168,56 +472,86 @@ class GeckoController:
             self.logger.error(f"Failed to initialize display: {e}")
             raise
 
-    async def update_display(self, temp, humidity, uva, uvb, uvc, light_status, heat_status):
+    async def update_display(self, temp, humidity, uva, uvb, uvc, light_status, heat_status, now=None,
+                             target_temp=None):
         """Update display with proper async handling"""
         if not hasattr(self, 'last_display_update'):
-            self.last_display_update = 0
+            self.last_display_update = float('-inf')
 
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self.last_display_update < 0.1:
             return
 
+        if now is None:
+            now = datetime.now()
+        display_key = self.display_key(temp, humidity, uva, uvb, light_status, heat_status, now)
+        if display_key == self._last_display_key:
+            self.logger.debug("Display inputs unchanged, skipping update")
+            return
+
         try:
             self.logger.info("Creating display buffer...")
 
             # Run display group creation in executor to avoid blocking
             loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
+            dirty = await loop.run_in_executor(
                 None,
                 self.create_display_group,
-                temp, humidity, uva, uvb, uvc, light_status, heat_status
+                temp, humidity, uva, uvb, uvc, light_status, heat_status, now, target_temp
             )
 
+            if not dirty:
+                self.logger.info("Display unchanged, skipping update")
+                self._last_display_key = display_key
+                self.last_display_update = current_time
+                return
+
             # Update physical display with timeout protection
+            shown = True
             if self.display:
                 self.logger.info("Updating physical display...")
                 try:
                     async with asyncio.timeout(1.0):
-                        await loop.run_in_executor(
+                        shown = await loop.run_in_executor(
                             None,
-                            lambda: self.display.show_image(self.image)
+                            lambda: self.display.show_image(self.image, dirty)
                         )
                         self.logger.info("Physical display updated")
                 except asyncio.TimeoutError:
                     self.logger.error("Physical display update timed out")
                     self.display = None
+                    shown = False
 
             # Update web interface
             if self.display_socket:
                 self.logger.info("Sending to web interface...")
-                await self.display_socket.send_image(self.image)
+                if not await self.display_socket.send_image_bytes(
+                        self._frame_buf, dirty, self.image.size, self.image.mode):
+                    shown = False
                 self.logger.info("Web interface updated")
 
+            # Only a frame that reached its outputs may suppress the next redraw
+            if shown:
+                self._last_display_key = display_key
+            else:
+                self.invalidate_display()
             self.last_display_update = current_time
 
         except Exception as e:
-            self.logger.error(f"Display update failed: {e}", exc_info=True)
+            self.invalidate_display()
+            self.logger.error(f"Display update failed: {e}")
             if current_time - self.last_display_update > 5:
                 try:
                     self.setup_display()
                 except Exception as setup_error:
                     self.logger.error(f"Display setup retry failed: {setup_error}")
 
+    def invalidate_display(self):
+        """Forget what was last drawn so the next update redraws every field"""
+        self._last_display_key = None
+        self._field_values = {}
+        self._frame_valid = False
+
     # Font loading helper
     def load_font(self, name: str, size: int) -> ImageFont.FreeTypeFont:
         """Load a font, falling back to default if not found"""
@@ -331,47 +665,38 @@ class GeckoController:
             self.display_socket = None
             return False
 
-    def get_next_transition(self) -> Tuple[str, datetime]:
-        """Calculate time until next light state change"""
-        now = datetime.now()
-        current_time = now.time()
-        
-        # Create datetime objects for today's on/off times
-        today_on = now.replace(
-            hour=self.light_on_time.hour,
-            minute=self.light_on_time.minute,
-            second=0,
-            microsecond=0
-        )
-        today_off = now.replace(
-            hour=self.light_off_time.hour,
-            minute=self.light_off_time.minute,
-            second=0,
-            microsecond=0
-        )
-        
-        if self.light_on_time <= current_time < self.light_off_time:
-            # Lights are on, calculate time until off
-            next_time = today_off
-            if next_time < now:
-                next_time += timedelta(days=1)
-            return "→OFF", next_time
+    @staticmethod
+    def format_duration(seconds: float) -> str:
+        """Format a countdown in seconds as e.g. 2h07m"""
+        hours, remainder = divmod(int(seconds), 3600)
+        return f"{hours}h{remainder // 60:02d}m"
+
+    def transition_countdown(self, now: datetime) -> Tuple[str, float]:
+        """Next light state change and the seconds until it, using time-of-day arithmetic"""
+        seconds_of_day = now.hour * 3600 + now.minute * 60 + now.second + now.microsecond / 1e6
+        if self.is_light_period(now.time()):
+            state, target = "→OFF", self._light_off_second
         else:
-            # Lights are off, calculate time until on
-            next_time = today_on
-            if next_time < now:
-                next_time += timedelta(days=1)
-            return "→ON", next_time
-
-    def format_time_until(self, target_time: datetime) -> str:
-        """Format the time until the next transition"""
-        now = datetime.now()
-        diff = target_time - now
-        hours = int(diff.total_seconds() // 3600)
-        minutes = int((diff.total_seconds() % 3600) // 60)
-        return f"{hours}h{minutes:02d}m"
-
-    def calculate_uv_correction(self, sensor_height=None, lamp_dist=None, enclosure_height=None, sensor_angle=None):
+            state, target = "→ON", self._light_on_second
+        return state, (target - seconds_of_day) % SECONDS_PER_DAY
+
+    def get_schedule_text(self, now: Optional[datetime] = None) -> str:
+        """Get the next transition text, recomputed at most once per minute"""
+        if now is None:
+            now = datetime.now()
+
+        minute_key = (now.date(), now.hour, now.minute)
+        if self._sched_cache is not None and self._sched_cache[0] == minute_key:
+            return self._sched_cache[1]
+
+        next_state, seconds_left = self.transition_countdown(now)
+        text = f"{next_state} {self.format_duration(seconds_left)}"
+        self._sched_cache = (minute_key, text)
+        return text
+
+    def calculate_uv_correction(self, sensor_height: Optional[float] = None, lamp_dist: Optional[float] = None,
+                                enclosure_height: Optional[float] = None,
+                                sensor_angle: Optional[float] = None) -> float:
         """
         Calculate UV correction factor based on geometry
 
@@ -395,18 +720,22 @@ class GeckoController:
         sensor_to_lamp_vert = enclosure_height - sensor_height  # vertical distance
 
         # Direct distance from sensor to lamp
-        direct_distance = math.sqrt(sensor_to_lamp_horiz**2 + sensor_to_lamp_vert**2)
-
-        # Angle between sensor normal and lamp
-        lamp_angle = math.degrees(math.atan2(sensor_to_lamp_vert, sensor_to_lamp_horiz))
-        effective_angle = abs(lamp_angle - sensor_angle)
+        distance_squared = sensor_to_lamp_horiz**2 + sensor_to_lamp_vert**2
+        direct_distance = math.sqrt(distance_squared)
 
-        # Cosine correction for sensor angle
-        cosine_factor = math.cos(math.radians(effective_angle))
+        # Cosine correction for the angle between sensor normal and lamp:
+        # cos(lamp - sensor) = cos(lamp)cos(sensor) + sin(lamp)sin(sensor),
+        # where cos/sin of the lamp angle are just the direction components
+        cos_sensor, sin_sensor = angle_cos_sin(sensor_angle)
+        cosine_factor = (sensor_to_lamp_horiz * cos_sensor + sensor_to_lamp_vert * sin_sensor) / direct_distance
 
         # Inverse square law correction for distance
         # Normalize to a reference height of 30cm (typical basking height)
-        distance_factor = (0.3 / direct_distance)**2
+        distance_factor = 0.09 / distance_squared
+
+        # Sensor perpendicular to the lamp sees nothing; every reading becomes out of range
+        if cosine_factor == 0:
+            return math.inf
 
         # Combined correction factor
         correction_factor = 1 / (cosine_factor * distance_factor)
@@ -418,233 +747,493 @@ class GeckoController:
         if value is None:
             return self.ICON_ERROR
 
-        thresholds = self.UVB_THRESHOLDS if is_uvb else self.UVA_THRESHOLDS
+        if is_uvb:
+            low, high = self._uvb_low, self._uvb_high
+        else:
+            low, high = self._uva_low, self._uva_high
 
-        if value < thresholds['low']:
+        if value < low:
             return self.ICON_TOO_LOW
-        elif value > thresholds['high']:
+        elif value > high:
             return self.ICON_TOO_HIGH
         else:
             return self.ICON_GOOD
 
-    def create_display_group(self, temp, humidity, uva, uvb, uvc, light_status, heat_status):
-        """Create a new display buffer with all information"""
-        # Clear the image
-        self.draw.rectangle((0, 0, 128, 64), fill=255)  # White background
-        
-        # Top row - Time and Humidity
-        current_time = datetime.now().strftime("%H:%M")
-        self.draw.text((4, 4), self.ICON_CLOCK, font=self.icon_font, fill=0)
-        self.draw.text((20, 4), current_time, font=self.regular_font, fill=0)
+    def render_static_layer(self) -> Image.Image:
+        """Render the icons and labels that stay fixed between frames"""
+        static = Image.new('1', (DISPLAY_WIDTH, DISPLAY_HEIGHT), 255)
+        draw = ImageDraw.Draw(static)
+        for position, name in self.STATIC_ICONS:
+            static.paste(ICONS[name], position)
+        for position, text in self.STATIC_LABELS:
+            draw.text(position, text, font=self.regular_font, fill=0)
+        return static
 
-        # Humidity
+    @staticmethod
+    def format_status_text(light_status: bool, heat_status: bool) -> str:
+        """Relay status line, e.g. 'L:ON  H:OFF'"""
+        return f"{'L:ON ' if light_status else 'L:OFF'} {'H:ON' if heat_status else 'H:OFF'}"
+
+    def render_status_tiles(self) -> Dict[str, Image.Image]:
+        """Pre-rasterize the four relay status lines so frames can paste them
+
+        Tiles span the rest of the status row: the 1-bit rasterizer can ink a
+        column past getbbox, and the row is blank in the static layer anyway.
+        """
+        tiles = {}
+        for light_status in (False, True):
+            for heat_status in (False, True):
+                text = self.format_status_text(light_status, heat_status)
+                x, y = self.FIELD_ORIGINS['status']
+                tile = Image.new('1', (DISPLAY_WIDTH - x, DISPLAY_HEIGHT - y), 255)
+                ImageDraw.Draw(tile).text((0, 0), text, font=self.regular_font, fill=0)
+                tiles[text] = tile
+        return tiles
+
+    def find_dirty_bands(self) -> List[Tuple[int, int, int, int]]:
+        """Return bounding boxes of the display bands that changed since the last frame"""
+        frame = self.image.tobytes()
+        band_bytes = len(frame) * DIRTY_BAND_HEIGHT // DISPLAY_HEIGHT
+        band_count = DISPLAY_HEIGHT // DIRTY_BAND_HEIGHT
+
+        if not self._frame_valid:
+            dirty = list(range(band_count))
+        else:
+            previous = memoryview(self._frame_buf)
+            current = memoryview(frame)
+            dirty = [
+                i for i in range(band_count)
+                if previous[i * band_bytes:(i + 1) * band_bytes] != current[i * band_bytes:(i + 1) * band_bytes]
+            ]
+
+        if dirty:
+            self._frame_buf[:] = frame
+            self._frame_valid = True
+
+        return [(0, i * DIRTY_BAND_HEIGHT, DISPLAY_WIDTH, (i + 1) * DIRTY_BAND_HEIGHT) for i in dirty]
+
+    def display_key(self, temp, humidity, uva, uvb, light_status, heat_status, now: datetime) -> tuple:
+        """Reduce the display inputs to what is actually drawn
+
+        Readings are rounded to the one decimal shown and UV to its icon, and
+        the schedule only moves per minute, so equal keys mean an identical frame.
+        """
+        return (
+            None if temp is None else round(temp, 1),
+            None if humidity is None else round(humidity, 1),
+            self.get_uv_status_icon(uva, is_uvb=False),
+            self.get_uv_status_icon(uvb, is_uvb=True),
+            bool(light_status),
+            bool(heat_status),
+            now.hour,
+            now.minute,
+        )
+
+    def create_display_group(self, temp: Optional[float], humidity: Optional[float],
+                             uva: Optional[float], uvb: Optional[float], uvc: Optional[float],
+                             light_status: bool, heat_status: bool, now: Optional[datetime] = None,
+                             target_temp: Optional[float] = None) -> List[Tuple[int, int, int, int]]:
+        """Create a new display buffer and return the regions that changed"""
+        if now is None:
+            now = datetime.now()
+        current_time = now.time()
+
+        # Top row - Time and Humidity
+        clock_text = CLOCK_FORMAT(now.hour, now.minute)
         humidity_text = f"{humidity:4.1f}%" if humidity is not None else "--.-%"
-        self.draw.text((68, 4), self.ICON_HUMIDITY, font=self.icon_font, fill=0)
-        self.draw.text((84, 4), humidity_text, font=self.regular_font, fill=0)
 
         # Temperature
         if temp is not None:
-            target_temp = self.get_target_temp()
+            if target_temp is None:
+                target_temp = self.get_target_temp(current_time)
             temp_text = f"{temp:4.1f}C"
             target_text = f"{target_temp:4.1f}C"
         else:
             temp_text = "--.-C"
             target_text = "--.-C"
 
-        self.draw.text((4, 20), self.ICON_THERMOMETER, font=self.icon_font, fill=0)
-        self.draw.text((20, 20), temp_text, font=self.regular_font, fill=0)
-        self.draw.text((68, 20), self.ICON_TARGET, font=self.icon_font, fill=0)
-        self.draw.text((84, 20), target_text, font=self.regular_font, fill=0)
-
         # UV readings
         uva_icon = self.get_uv_status_icon(uva, is_uvb=False)
         uvb_icon = self.get_uv_status_icon(uvb, is_uvb=True)
-        
-        self.draw.text((4, 36), "UVA", font=self.regular_font, fill=0)
-        self.draw.text((36, 36), uva_icon, font=self.icon_font, fill=0)
-        self.draw.text((68, 36), "UVB", font=self.regular_font, fill=0)
-        self.draw.text((100, 36), uvb_icon, font=self.icon_font, fill=0)
 
         # Status and Schedule
-        status_text = f"{'L:ON ' if light_status else 'L:OFF'} {'H:ON' if heat_status else 'H:OFF'}"
-        self.draw.text((4, 52), status_text, font=self.regular_font, fill=0)
-
-        next_state, next_time = self.get_next_transition()
-        time_until = self.format_time_until(next_time)
-        schedule_text = f"{next_state} {time_until}"
-        
-        # Right-align the schedule text
-        schedule_width = self.draw.textlength(schedule_text, font=self.regular_font)
-        self.draw.text((124 - schedule_width, 52), schedule_text, font=self.regular_font, fill=0)
-
-    def log_readings(self, temp, humidity, uva, uvb, uvc, light_status, heat_status):
-        """Log readings if enough time has passed"""
-        current_time = time.time()
-        if current_time - self.last_log_time >= LOG_INTERVAL:
-            self.readings_logger.info(
-                "",
-                extra={
-                    'temp': temp if temp is not None else -1,
-                    'humidity': humidity if humidity is not None else -1,
-                    'uva': uva if uva is not None else -1,
-                    'uvb': uvb if uvb is not None else -1,
-                    'uvc': uvc if uvc is not None else -1,
-                    'light': 1 if light_status else 0,
-                    'heat': 1 if heat_status else 0
-                }
-            )
-            self.last_log_time = current_time
+        status_text = self.format_status_text(light_status, heat_status)
+        schedule_text = self.get_schedule_text(now)
+
+        fields = {
+            'time': clock_text,
+            'humidity': humidity_text,
+            'temp': temp_text,
+            'target': target_text,
+            'uva_icon': uva_icon,
+            'uvb_icon': uvb_icon,
+            'status': (status_text, schedule_text),
+        }
+
+        # Only redraw fields whose content changed since the last frame
+        changed = [name for name, value in fields.items() if self._field_values.get(name) != value]
+        if not changed:
+            return []
+
+        for name in changed:
+            # Restore the static background under the field, then draw its new value
+            self.image.paste(self._static_crops[name], self.FIELD_REGIONS[name][:2])
+            origin = self.FIELD_ORIGINS[name]
+
+            if name == 'uva_icon':
+                self.image.paste(self._icon_tiles[uva_icon], origin)
+            elif name == 'uvb_icon':
+                self.image.paste(self._icon_tiles[uvb_icon], origin)
+            elif name == 'status':
+                self.image.paste(self._status_tiles[status_text], origin)
+
+                # Right-align the schedule text
+                schedule_width = self.draw.textlength(schedule_text, font=self.regular_font)
+                self.draw.text((self.SCHEDULE_RIGHT_EDGE - schedule_width, origin[1]), schedule_text,
+                               font=self.regular_font, fill=0)
+            else:
+                self.draw.text(origin, fields[name], font=self.regular_font, fill=0)
 
-    def read_sensor(self) -> Tuple[Optional[float], Optional[float]]:
-        """Read temperature and humidity from the sensor"""
-        try:
-            # First check if bus is accessible at all
-            if not hasattr(self, 'bus') or self.bus is None:
-                self.logger.error("I2C bus not initialized")
-                return None, None
+        self._field_values.update(fields)
+        return self.find_dirty_bands()
 
-            # Read with timeout protection
-            try:
-                # Try to write measurement command
-                self.bus.write_i2c_block_data(0x44, 0x2C, [0x06])
+    @staticmethod
+    def format_readings_row(now: datetime, temp, humidity, uva, uvb, uvc, light_status, heat_status) -> str:
+        """Format one readings CSV row, matching the old logging asctime layout"""
+        stamp = now.isoformat(' ', 'milliseconds')
+        return (
+            f"{stamp[:19]},{stamp[20:]},"
+            f"{temp if temp is not None else -1:.1f},"
+            f"{humidity if humidity is not None else -1:.1f},"
+            f"{uva if uva is not None else -1:.4f},"
+            f"{uvb if uvb is not None else -1:.4f},"
+            f"{uvc if uvc is not None else -1:.4f},"
+            f"{1 if light_status else 0},{1 if heat_status else 0}\n"
+        )
 
-                # Use shorter sleep - 100ms is typically enough for SHT31
-                time.sleep(0.1)
+    def log_readings(self, temp: Optional[float], humidity: Optional[float],
+                     uva: Optional[float], uvb: Optional[float], uvc: Optional[float],
+                     light_status: bool, heat_status: bool, now: Optional[datetime] = None):
+        """Log readings if enough time has passed"""
+        current_time = time.monotonic()
+        if current_time - self.last_log_time < LOG_INTERVAL:
+            return
 
-                # Read data with retry
-                retries = 3
-                for attempt in range(retries):
+        if now is None:
+            now = datetime.now()
+        self.readings_log.put(self.format_readings_row(
+            now, temp, humidity, uva, uvb, uvc, light_status, heat_status
+        ))
+        self.last_log_time = current_time
+
+    async def readings_writer(self):
+        """Drain queued readings and write them to disk in batches"""
+        queue = self.readings_log.queue
+        loop = asyncio.get_running_loop()
+        batch = []
+        failures = 0
+        try:
+            while True:
+                batch.append(await queue.get())
+                deadline = loop.time() + READINGS_FLUSH_INTERVAL
+
+                # Collect whatever else arrives before the deadline
+                while len(batch) < READINGS_BATCH_SIZE:
                     try:
-                        data = self.bus.read_i2c_block_data(0x44, 0x00, 6)
+                        async with asyncio.timeout_at(deadline):
+                            batch.append(await queue.get())
+                    except asyncio.TimeoutError:
                         break
-                    except OSError as e:
-                        if attempt == retries - 1:
-                            raise
-                        time.sleep(0.1)
-
-                # Convert raw data to temperature and humidity
-                temp = data[0] * 256 + data[1]
-                cTemp = -45 + (175 * temp / 65535.0)
-                humidity = 100 * (data[3] * 256 + data[4]) / 65535.0
-
-                # Basic sanity check on values
-                if not (-40 <= cTemp <= 125) or not (0 <= humidity <= 100):
-                    self.logger.warning(f"Sensor values out of range: T={cTemp}°C, RH={humidity}%")
-                    return None, None
-
-                self.logger.debug(f"Read sensor: T={cTemp:.1f}°C, RH={humidity:.1f}%")
-                return cTemp, humidity
-
-            except OSError as e:
-                self.logger.error(f"I2C communication error: {e}")
-                # Try to reset the I2C bus if we get repeated errors
+
+                records, batch = batch, []
+                # A lost batch must never take down control_loop in the same TaskGroup
                 try:
-                    self.bus.close()
-                    time.sleep(0.1)
-                    self.bus = smbus2.SMBus(1)
-                except Exception as reset_error:
-                    self.logger.error(f"Failed to reset I2C bus: {reset_error}")
-                return None, None
+                    await loop.run_in_executor(None, self.readings_log.write_batch, records)
+                    failures = 0
+                except Exception as e:
+                    failures += 1
+                    if failures == 1 or failures % SENSOR_ERROR_LOG_EVERY == 0:
+                        self.logger.error(f"Readings write failed ({failures} in a row): {e}")
+        finally:
+            # Flush anything still queued so no readings are lost on shutdown
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            if batch:
+                try:
+                    self.readings_log.write_batch(batch)
+                except Exception as e:
+                    self.logger.error(f"Readings write failed on shutdown: {e}")
 
-        except Exception as e:
-            self.logger.error(f"Sensor read error: {e}")
-            self.logger.debug(f"Stack trace: {traceback.format_exc()}")
+    def sht_transfer(self, msg: i2c_msg):
+        """Run a prebuilt SHT31 message as a single combined I2C transfer"""
+        self.bus.i2c_rdwr(msg)
+
+    def start_temp_conversion(self) -> bool:
+        """Start an SHT31 measurement so the next read_sensor call finds it ready"""
+        if not hasattr(self, 'bus') or self.bus is None:
+            return False
+
+        try:
+            self.sht_transfer(self._sht_measure_msg)
+            self._temp_pending_since = time.monotonic()
+            return True
+        except OSError as e:
+            self.record_sensor_error("SHT31", f"could not start conversion: {e}")
+            self._temp_pending_since = None
+            return False
+
+    def read_sensor(self) -> Tuple[Optional[float], Optional[float]]:
+        """Read temperature and humidity, starting a conversion only if none is pending"""
+        # First check if bus is accessible at all
+        if not hasattr(self, 'bus') or self.bus is None:
+            self.record_sensor_error("SHT31", "I2C bus not initialized")
+            return None, None
+
+        try:
+            if self._temp_pending_since is None:
+                self.sht_transfer(self._sht_measure_msg)
+                self._temp_pending_since = time.monotonic()
+
+            started = self._temp_pending_since
+            self._temp_pending_since = None
+
+            # Sleep through the bulk of a conversion that is still running
+            remaining = SHT31_CONVERSION_TIME - (time.monotonic() - started)
+            if remaining > 0:
+                time.sleep(remaining)
+
+            # Without clock stretching the sensor NACKs its read header until
+            # the result is ready, so poll briefly instead of over-sleeping
+            deadline = started + SHT31_READ_TIMEOUT
+            while True:
+                try:
+                    # Plain read - the SHT31 has no register address to send first
+                    self.sht_transfer(self._sht_read_msg)
+                    data = bytes(self._sht_read_msg)
+                    break
+                except OSError:
+                    if time.monotonic() >= deadline:
+                        raise
+                    time.sleep(SHT31_POLL_INTERVAL)
+
+        except OSError as e:
+            self._temp_pending_since = None
+            self.record_sensor_error("SHT31", e)
+            # Try to reset the I2C bus if we get repeated errors
+            try:
+                self.bus.close()
+                time.sleep(0.1)
+                self.bus = smbus2.SMBus(1)
+            except OSError as reset_error:
+                self.logger.error(f"Failed to reset I2C bus: {reset_error}")
             return None, None
 
+        self.record_sensor_ok("SHT31")
+
+        # Convert raw data to temperature and humidity
+        raw_temp, _, raw_humidity = SHT31_RESULT.unpack(data)
+        cTemp = raw_temp * SHT31_TEMP_SCALE - 45.0
+        humidity = raw_humidity * SHT31_RH_SCALE
+
+        # Basic sanity check on values
+        if not (-40 <= cTemp <= 125) or not (0 <= humidity <= 100):
+            self.logger.warning(f"Sensor values out of range: T={cTemp}°C, RH={humidity}%")
+            return None, None
+
+        self.logger.debug("Read sensor: T=%.1f°C, RH=%.1f%%", cTemp, humidity)
+        return cTemp, humidity
+
+    def record_sensor_error(self, sensor: str, error):
+        """Count a failed sensor read, logging only the start of a streak and every SENSOR_ERROR_LOG_EVERY failures"""
+        streak = self._error_streaks.get(sensor, 0) + 1
+        self._error_streaks[sensor] = streak
+        if streak == 1 or streak % SENSOR_ERROR_LOG_EVERY == 0:
+            self.logger.error(f"{sensor} read failed ({streak} in a row): {error}")
+
+    def record_sensor_ok(self, sensor: str):
+        """End a sensor's error streak, logging the recovery if there was one"""
+        streak = self._error_streaks.pop(sensor, 0)
+        if streak:
+            self.logger.info(f"{sensor} recovered after {streak} failed reads")
+
+    def correct_uv_values(self, uva, uvb, uvc) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+        """Apply the precomputed geometric correction to raw UV readings"""
+        factor = self.uv_correction_factor
+        corrected = tuple(
+            None if value is None else round(value * factor, 3)
+            for value in (uva, uvb, uvc)
+        )
+
+        # Sanity check on corrected values
+        if any(value is not None and value > UV_MAX_CORRECTED for value in corrected):
+            self.logger.warning(f"Corrected UV value too high: {corrected} μW/cm²")
+            corrected = tuple(
+                None if value is not None and value > UV_MAX_CORRECTED else value
+                for value in corrected
+            )
+        return corrected
+
     async def read_uv(self) -> Tuple[Optional[float], Optional[float], Optional[float]]:
         """Read UV values from AS7331 sensor and apply geometric correction."""
-        try:
-            if self.uv_sensor is None:
-                self.logger.error("UV sensor not initialized")
-                return None, None, None
+        if self.uv_sensor is None:
+            self.record_sensor_error("UV sensor", "not initialized")
+            self.retry_uv_sensor_setup()
+            return None, None, None
 
-            # Maximum retries for sensor read
-            retries = 3
-            last_error = None
+        # Already imported by setup_uv_sensor, so this is a sys.modules lookup
+        from gecko_controller.as7331 import AS7331Overflow
 
-            for attempt in range(retries):
-                try:
-                    # Use async version with timeout
-                    async with asyncio.timeout(5.0):  # 5 second overall timeout
-                        uva, uvb, uvc, temp = await self.uv_sensor.async_get_values()
-
-                    # Validate raw readings
-                    if any(v is not None and (v < 0 or v > 1000000) for v in (uva, uvb, uvc)):
-                        self.logger.warning(f"UV values out of expected range: UVA={uva}, UVB={uvb}, UVC={uvc}")
-                        continue
-
-                    # Apply geometric correction and round to reasonable precision
-                    corrected_values = []
-                    for value in (uva, uvb, uvc):
-                        if value is not None:
-                            # Apply correction and round to 3 decimal places
-                            corrected = round(value * self.uv_correction_factor, 3)
-                            # Sanity check on corrected values
-                            if corrected > 100000:  # Unreasonably high UV
-                                self.logger.warning(f"Corrected UV value too high: {corrected} μW/cm²")
-                                corrected = None
-                        else:
-                            corrected = None
-                        corrected_values.append(corrected)
-
-                    return tuple(corrected_values)
+        # Maximum retries for sensor read
+        retries = 3
+        last_error = None
 
-                except asyncio.TimeoutError:
-                    last_error = "Timeout reading UV sensor"
-                    self.logger.warning(f"UV sensor read attempt {attempt + 1}/{retries} timed out")
-                    await asyncio.sleep(0.5)  # Short delay between retries
-                    continue
+        for attempt in range(retries):
+            try:
+                # Use async version with timeout
+                async with asyncio.timeout(5.0):  # 5 second overall timeout
+                    uva, uvb, uvc, temp = await self.uv_sensor.async_get_values()
 
-                except Exception as e:
-                    last_error = str(e)
-                    self.logger.warning(f"UV sensor read attempt {attempt + 1}/{retries} failed: {e}")
-                    if attempt < retries - 1:
-                        await asyncio.sleep(0.5)
+                # Validate raw readings
+                if any(v is not None and (v < 0 or v > 1000000) for v in (uva, uvb, uvc)):
+                    self.logger.warning(f"UV values out of expected range: UVA={uva}, UVB={uvb}, UVC={uvc}")
                     continue
 
-            # If we get here, all retries failed
-            if last_error:
-                self.logger.error(f"UV sensor read failed after {retries} attempts: {last_error}")
-                # Try to recover sensor
-                try:
-                    self.setup_uv_sensor()
-                    self.logger.info("UV sensor reinitialized after failures")
-                except Exception as reinit_error:
-                    self.logger.error(f"Failed to reinitialize UV sensor: {reinit_error}")
+                self.record_sensor_ok("UV sensor")
+                return self.correct_uv_values(uva, uvb, uvc)
 
-            return None, None, None
+            except asyncio.TimeoutError:
+                last_error = "Timeout reading UV sensor"
+                self.logger.debug(f"UV sensor read attempt {attempt + 1}/{retries} timed out")
+                await asyncio.sleep(0.5)  # Short delay between retries
+                continue
 
-        except Exception as e:
-            self.logger.error(f"Unexpected error reading UV sensor: {e}")
-            self.logger.debug(f"Stack trace: {traceback.format_exc()}")
-            return None, None, None
+            except (OSError, AS7331Overflow) as e:
+                last_error = str(e)
+                self.logger.debug(f"UV sensor read attempt {attempt + 1}/{retries} failed: {e}")
+                if attempt < retries - 1:
+                    await asyncio.sleep(0.5)
+                continue
+
+        # If we get here, all retries failed
+        if last_error:
+            self.record_sensor_error("UV sensor", f"{last_error} after {retries} attempts")
+            self.retry_uv_sensor_setup()
 
-    def get_target_temp(self) -> float:
+        return None, None, None
+
+    def retry_uv_sensor_setup(self):
+        """Re-initialize the UV sensor on a backoff schedule of the current failure streak
+
+        setup_uv_sensor scans the bus and logs every step, so an unplugged
+        sensor is only retried after 1, 2, 4, ... failed reads and then every
+        UV_REINIT_BACKOFF_MAX failures.
+        """
+        streak = self._error_streaks.get("UV sensor", 0)
+        if streak < UV_REINIT_BACKOFF_MAX:
+            due = streak & (streak - 1) == 0
+        else:
+            due = streak % UV_REINIT_BACKOFF_MAX == 0
+        if not due:
+            return
+
+        try:
+            self.setup_uv_sensor()
+        except Exception as reinit_error:
+            self.logger.error(f"Failed to reinitialize UV sensor: {reinit_error}")
+            return
+        if self.uv_sensor is not None:
+            self.logger.info(f"UV sensor reinitialized after {streak} failed reads")
+
+    def is_light_period(self, current_time: Optional[datetime_time] = None) -> bool:
+        """Check whether the lights should be on, cached per minute of the day"""
+        if current_time is None:
+            current_time = datetime.now().time()
+
+        # On/off times are whole minutes, so the answer is fixed within a minute
+        minute_key = (current_time.hour, current_time.minute)
+        if self._light_period_cache is None or self._light_period_cache[0] != minute_key:
+            active = self.light_on_time <= current_time < self.light_off_time
+            self._light_period_cache = (minute_key, active)
+        return self._light_period_cache[1]
+
+    def get_target_temp(self, current_time: Optional[datetime_time] = None) -> float:
         """Get the current target temperature based on time of day"""
-        current_time = datetime.now().time()
-        return self.config.DAY_TEMP if self.light_on_time <= current_time < self.light_off_time else self.config.MIN_TEMP
+        return self.config.DAY_TEMP if self.is_light_period(current_time) else self.config.MIN_TEMP
+
+    def tick_state(self, current_time: datetime_time) -> Tuple[bool, float]:
+        """Light period and target temperature for one control tick"""
+        lights_on = self.is_light_period(current_time)
+        return lights_on, self.config.DAY_TEMP if lights_on else self.config.MIN_TEMP
 
-    def control_light(self) -> bool:
+    def control_light(self, current_time: Optional[datetime_time] = None,
+                      should_be_on: Optional[bool] = None) -> bool:
         """Control the light relay based on time"""
-        current_time = datetime.now().time()
-        should_be_on = self.light_on_time <= current_time < self.light_off_time
-        GPIO.output(self.config.LIGHT_RELAY, GPIO.HIGH if should_be_on else GPIO.LOW)
+        if should_be_on is None:
+            should_be_on = self.is_light_period(current_time)
+        self.write_relays(light_on=should_be_on)
         return should_be_on
- 
-    def control_heat(self, current_temp: Optional[float]) -> bool:
+
+    def control_heat(self, current_temp: Optional[float], current_time: Optional[datetime_time] = None,
+                     target_temp: Optional[float] = None) -> bool:
         """Control the heat relay based on temperature"""
-        if current_temp is None:
+        should_heat = self.decide_heat(current_temp, current_time, target_temp)
+        if should_heat is None:
             return False
+        self.write_relays(heat_on=should_heat)
+        return should_heat
+
+    def smooth_temp(self, temp: Optional[float]) -> Optional[float]:
+        """Add a reading to the temperature ring and return the mean of the recent samples"""
+        if temp is None:
+            return None
+
+        self._temp_ring[self._temp_ring_index] = temp
+        self._temp_ring_index = (self._temp_ring_index + 1) % TEMP_SMOOTHING_SAMPLES
+        if self._temp_ring_count < TEMP_SMOOTHING_SAMPLES:
+            self._temp_ring_count += 1
+        return sum(self._temp_ring[:self._temp_ring_count]) / self._temp_ring_count
+
+    def decide_heat(self, current_temp: Optional[float], current_time: Optional[datetime_time] = None,
+                    target_temp: Optional[float] = None) -> Optional[bool]:
+        """Heat relay state for a reading, or None when there is no reading to act on"""
+        if current_temp is None:
+            return None
 
-        target_temp = self.get_target_temp()
+        if target_temp is None:
+            target_temp = self.get_target_temp(current_time)
 
         if current_temp < (target_temp - self.config.TEMP_TOLERANCE):
-            GPIO.output(self.config.HEAT_RELAY, GPIO.HIGH)
             return True
         elif current_temp > (target_temp + self.config.TEMP_TOLERANCE):
-            GPIO.output(self.config.HEAT_RELAY, GPIO.LOW)
             return False
-        return GPIO.input(self.config.HEAT_RELAY)
+        # Inside the hysteresis band - keep whatever we last wrote
+        return self._heat_state
+
+    def write_relays(self, light_on: Optional[bool] = None, heat_on: Optional[bool] = None):
+        """Drive the relays whose state changed, batching both into one GPIO call
+
+        None leaves that relay alone.
+        """
+        channels = []
+        values = []
+        if light_on is not None and light_on != self._light_state:
+            channels.append(self.config.LIGHT_RELAY)
+            values.append(GPIO.HIGH if light_on else GPIO.LOW)
+        if heat_on is not None and heat_on != self._heat_state:
+            channels.append(self.config.HEAT_RELAY)
+            values.append(GPIO.HIGH if heat_on else GPIO.LOW)
+
+        if not channels:
+            return
+        if len(channels) == 1:
+            GPIO.output(channels[0], values[0])
+        else:
+            GPIO.output(channels, values)
+
+        if light_on is not None:
+            self._light_state = light_on
+        if heat_on is not None:
+            self._heat_state = heat_on
 
 
     async def run(self):
@@ -652,20 +1241,17 @@ class GeckoController:
         try:
             # Initialize display socket
             socket_initialized = await self.setup_socket()
-            if not socket_initialized:
-                self.logger.warning("Running without display socket")
-                self.tasks = [
-                    asyncio.create_task(self.control_loop(), name='control_loop')
-                ]
-            else:
-                self.logger.info("Starting control and display tasks")
-                self.tasks = [
-                    asyncio.create_task(self.display_socket.serve_forever(), name='socket_server'),
-                    asyncio.create_task(self.control_loop(), name='control_loop')
-                ]
 
-            # Run until cancelled
-            await asyncio.gather(*self.tasks)
+            # Run until cancelled; leaving the group cancels and awaits every child
+            async with asyncio.TaskGroup() as tg:
+                if not socket_initialized:
+                    self.logger.warning("Running without display socket")
+                else:
+                    self.logger.info("Starting control and display tasks")
+                    tg.create_task(self.display_socket.serve_forever(), name='socket_server')
+                tg.create_task(self.control_loop(), name='control_loop')
+                tg.create_task(self.uv_reader(), name='uv_reader')
+                tg.create_task(self.readings_writer(), name='readings_writer')
 
         except asyncio.CancelledError:
             self.logger.info("Received shutdown signal")
@@ -678,62 +1264,160 @@ class GeckoController:
     async def control_loop(self):
         """Separated control loop for clarity"""
         self.logger.info("Starting control loop")
+        # Monotonic deadline of the next regular tick; ticks stay on this
+        # fixed grid however long the sensor reads take
+        next_tick = time.monotonic()
+        loop = asyncio.get_running_loop()
         while True:
             try:
-                self.logger.info("=== Starting control loop iteration ===")
+                self.logger.debug("=== Starting control loop iteration ===")
 
-                # Temperature/Humidity read
-                try:
-                    self.logger.info("Reading temperature sensor...")
-                    start_time = time.time()
-                    temp, humidity = self.read_sensor()
-                    self.logger.info(f"Temperature read took {time.time() - start_time:.2f}s")
-                    if temp is None or humidity is None:
-                        self.logger.error("Failed to read temperature/humidity")
-                    else:
-                        self.logger.info(f"Temperature: {temp:.2f}°C, Humidity: {humidity:.2f}%")
-                except Exception as e:
-                    self.logger.error(f"Temperature sensor error: {e}")
-                    temp, humidity = None, None
+                # Capture the wall clock once and share it with every consumer this tick
+                now = datetime.now()
+                current_time = now.time()
+                tick_start = time.monotonic()
+                lights_on, target_temp = self.tick_state(current_time)
+
+                # Temperature/Humidity read blocks on I2C, so it runs on a worker thread
+                self.logger.debug("Reading temperature sensor...")
+                sht_start = time.monotonic()
+                sht_read = loop.run_in_executor(None, self.read_sensor)
+
+                # UV comes from uv_reader's latest snapshot; ask it for a
+                # fresh one when the lamp is about to switch
+                if lights_on != self._light_state:
+                    self._uv_wake.set()
+                uva, uvb, uvc = self._last_uv
 
-                # UV read
                 try:
-                    self.logger.info("Reading UV sensors...")
-                    start_time = time.time()
-                    uva, uvb, uvc = await self.read_uv()
-                    self.logger.info(f"UV read took {time.time() - start_time:.2f}s")
-                    self.logger.info(f"UV levels - A: {uva}, B: {uvb}, C: {uvc}")
+                    temp, humidity = await sht_read
+                    self.logger.debug("Temperature read done after %.2fs", time.monotonic() - sht_start)
+
+                    # Failures are logged, throttled, by read_sensor; after one it
+                    # starts its own conversion, so only prefetch after a good read
+                    if temp is not None and humidity is not None:
+                        # Convert in the background while the rest of the loop runs
+                        self.start_temp_conversion()
+                        self.logger.info("Temperature: %.2f°C, Humidity: %.2f%%", temp, humidity)
                 except Exception as e:
-                    self.logger.error(f"UV sensor error: {e}", exc_info=True)
-                    uva, uvb, uvc = None, None, None
+                    self.logger.warning(f"Temperature sensor error: {e}")
+                    temp, humidity = None, None
 
                 # Control state updates
                 try:
-                    self.logger.info("Updating control states...")
-                    light_status = self.control_light()
-                    heat_status = self.control_heat(temp)
-                    self.logger.info(f"Light: {'ON' if light_status else 'OFF'}, Heat: {'ON' if heat_status else 'OFF'}")
+                    self.logger.debug("Updating control states...")
+                    light_status = lights_on
+                    # Smoothed so a single noisy reading can't flip the relay;
+                    # the display and log keep the instantaneous value
+                    heat_status = self.decide_heat(self.smooth_temp(temp), current_time, target_temp)
+                    # Both relays in one GPIO call when they change together
+                    self.write_relays(light_status, heat_status)
+                    heat_status = bool(heat_status)
+                    self.logger.info("Light: %s, Heat: %s", 'ON' if light_status else 'OFF', 'ON' if heat_status else 'OFF')
                 except Exception as e:
-                    self.logger.error(f"Control state error: {e}", exc_info=True)
+                    self.logger.error(f"Control state error: {e}")
                     light_status = heat_status = False
 
-                # Display update
-                try:
-                    self.logger.info("Updating display...")
-                    start_time = time.time()
-                    await self.update_display(temp, humidity, uva, uvb, uvc,
-                                        light_status, heat_status)
-                    self.logger.info(f"Display update took {time.time() - start_time:.2f}s")
-                except Exception as e:
-                    self.logger.error(f"Display update error: {e}", exc_info=True)
+                # Until the first UV read lands, _last_uv is a placeholder; skip
+                # the log row and redraw rather than record it as a sensor error.
+                # uv_reader wakes the loop as soon as the read finishes.
+                if self._uv_ready.is_set():
+                    # Readings log (rate limited to LOG_INTERVAL)
+                    self.log_readings(temp, humidity, uva, uvb, uvc, light_status, heat_status, now)
 
-                self.logger.info("=== Control loop iteration complete, waiting 10s ===")
-                await asyncio.sleep(10)
+                    # Display update
+                    try:
+                        self.logger.debug("Updating display...")
+                        start_time = time.monotonic()
+                        await self.update_display(temp, humidity, uva, uvb, uvc,
+                                            light_status, heat_status, now, target_temp)
+                        self.logger.debug("Display update took %.2fs", time.monotonic() - start_time)
+                    except Exception as e:
+                        self.logger.error(f"Display update error: {e}")
+
+                # Wake early for a light transition or an external refresh request
+                tick_end = time.monotonic()
+                next_tick = self.advance_deadline(next_tick, tick_end)
+                next_wake = self.seconds_until_next_wake(now, tick_end - tick_start, next_tick - tick_end)
+                self.logger.debug("=== Control loop iteration complete, waiting %.1fs ===", next_wake)
+                await self.wait_for_wake(next_wake)
 
             except Exception as e:
                 self.logger.error(f"Critical error in control loop: {e}", exc_info=True)
                 await asyncio.sleep(1)  # Brief pause before retry
 
+    async def uv_reader(self):
+        """Read the UV sensor at its own rate and publish the latest values
+
+        The AS7331 integration wait never holds up a control tick. A read
+        is taken every UV_READ_INTERVAL, when the control loop signals a
+        lamp switch, or one CONTROL_INTERVAL after a failed read.
+        """
+        while True:
+            try:
+                self.logger.debug("Reading UV sensors...")
+                start_time = time.monotonic()
+                uva, uvb, uvc = await self.read_uv()
+                self.logger.debug("UV read took %.2fs", time.monotonic() - start_time)
+                self.logger.info("UV levels - A: %s, B: %s, C: %s", uva, uvb, uvc)
+            except Exception as e:
+                self.logger.warning(f"UV sensor error: {e}")
+                uva, uvb, uvc = None, None, None
+
+            # Redraw straight away after the first read, or if the change
+            # shows up on screen
+            previous = self._last_uv
+            self._last_uv = (uva, uvb, uvc)
+            if not self._uv_ready.is_set():
+                self._uv_ready.set()
+                self.request_refresh()
+            elif (self.get_uv_status_icon(uva) != self.get_uv_status_icon(previous[0])
+                    or self.get_uv_status_icon(uvb, is_uvb=True) != self.get_uv_status_icon(previous[1], is_uvb=True)):
+                self.request_refresh()
+
+            failed = all(value is None for value in self._last_uv)
+            try:
+                async with asyncio.timeout(CONTROL_INTERVAL if failed else UV_READ_INTERVAL):
+                    await self._uv_wake.wait()
+            except asyncio.TimeoutError:
+                pass
+            self._uv_wake.clear()
+
+    def request_refresh(self):
+        """Wake the control loop for an immediate update"""
+        self._wake_event.set()
+
+    @staticmethod
+    def advance_deadline(deadline: float, current: float) -> float:
+        """Move a passed tick deadline to the next CONTROL_INTERVAL slot after current
+
+        Overrun slots are skipped rather than run back to back. A deadline
+        still in the future (after an early wake) is left alone.
+        """
+        if deadline <= current:
+            deadline += ((current - deadline) // CONTROL_INTERVAL + 1) * CONTROL_INTERVAL
+        return deadline
+
+    def seconds_until_next_wake(self, now: datetime, elapsed: float = 0.0,
+                                until_tick: float = CONTROL_INTERVAL) -> float:
+        """Seconds to sleep: until the next regular tick, or less if a light transition is due
+
+        elapsed is how long the tick has run since now was captured, so the
+        wall clock does not need to be read again.
+        """
+        _, seconds_left = self.transition_countdown(now)
+        until_transition = seconds_left - elapsed + TRANSITION_WAKE_MARGIN
+        return max(0.0, min(until_tick, until_transition))
+
+    async def wait_for_wake(self, timeout: float):
+        """Sleep until the timeout expires or request_refresh is called"""
+        try:
+            async with asyncio.timeout(timeout):
+                await self._wake_event.wait()
+        except asyncio.TimeoutError:
+            pass
+        self._wake_event.clear()
+
     async def cleanup(self):
         """Cleanup resources before shutdown with proper task cancellation"""
         try:
@@ -742,22 +1426,16 @@ class GeckoController:
             # Set longer timeout for cleanup operations
             cleanup_timeout = 10.0  # 10 seconds total timeout
 
+            # Tasks are cancelled by the TaskGroup in run() before we get here
+            loop = asyncio.get_running_loop()
             async with asyncio.timeout(cleanup_timeout):
-                # Cancel all tasks
-                pending = [task for task in self.tasks if not task.done()]
-                if pending:
-                    self.logger.info(f"Cancelling {len(pending)} pending tasks...")
-                    for task in pending:
-                        task.cancel()
-
-                    # Wait for all tasks to complete or be cancelled
-                    await asyncio.gather(*pending, return_exceptions=True)
-
                 # Stop the display socket server if it exists
                 if self.display_socket:
                     self.logger.info("Stopping display socket...")
                     try:
-                        await asyncio.wait_for(self.display_socket.stop(), timeout=2.0)
+                        # Nested deadline, no extra wrapper task as with wait_for
+                        async with asyncio.timeout_at(loop.time() + 2.0):
+                            await self.display_socket.stop()
                     except asyncio.TimeoutError:
                         self.logger.warning("Display socket stop timed out")
 
@@ -774,6 +1452,7 @@ class GeckoController:
 
 async def main():
     """Main entry point with proper signal handling"""
+    logger = logging.getLogger('gecko_controller')
     try:
         # Create controller
         controller = GeckoController()
@@ -783,9 +1462,10 @@ async def main():
         shutdown_event = asyncio.Event()
 
         def signal_handler(signame):
+            # add_signal_handler runs this on the loop itself, woken through
+            # its signal fd, so the event can be set directly
             logger.info(f"Received signal {signame}")
-            # Use call_soon_threadsafe to safely set event from signal handler
-            loop.call_soon_threadsafe(shutdown_event.set)
+            shutdown_event.set()
 
         # Register signal handlers
         for signame in ('SIGINT', 'SIGTERM'):
@@ -812,7 +1492,8 @@ async def main():
 
             # Run cleanup with timeout
             logger.info("Running cleanup...")
-            await asyncio.wait_for(controller.cleanup(), timeout=15.0)
+            async with asyncio.timeout(15.0):
+                await controller.cleanup()
 
         except asyncio.TimeoutError:
             logger.error("Shutdown timed out")
@@ -1,24 +1,30 @@
 import asyncio
 import threading
 import os
-import json
-import base64
+import struct
 import logging
-from io import BytesIO
 from PIL import Image
-from typing import Optional, Tuple, Dict
+from typing import Optional, Tuple, Dict, List
 from dataclasses import dataclass
 
+# Each response is a fixed header followed by the payload: payload length,
+# width, height and mode id, then the raw Image.tobytes() pixel data. Mode id
+# 0 means no image is available and the payload is a UTF-8 error message.
+FRAME_HEADER = struct.Struct('!IHHB')
+IMAGE_MODES = ('1', 'L', 'RGB')  # Wire mode id is the index + 1
+NO_IMAGE = 0
+
+_NO_IMAGE_MESSAGE = b'No image available'
+NO_IMAGE_RESPONSE = FRAME_HEADER.pack(len(_NO_IMAGE_MESSAGE), 0, 0, NO_IMAGE) + _NO_IMAGE_MESSAGE
+
 @dataclass
 class SocketConfig:
     socket_path: str = "/var/run/gecko-controller/display.sock"
-    chunk_size: int = 4096
     timeout: int = 10        # Increased to 10 seconds per operation
     max_retries: int = 10    # Increased to 10 retries
     retry_delay: float = 1.0 # Added explicit retry delay
     permissions: int = 0o660
     max_size: int = 10 * 1024 * 1024
-    compression_quality: int = 85
 
 class ImageSocketBase:
     def __init__(self, config: Optional[SocketConfig] = None):
@@ -45,23 +51,6 @@ class ImageSocketBase:
             self.logger.error(f"Failed to create socket directory: {e}")
             raise
 
-    def _compress_image(self, image: Image.Image) -> bytes:
-        with BytesIO() as buffer:
-            image.save(buffer, format='JPEG',
-                      quality=self.config.compression_quality,
-                      optimize=True)
-            return buffer.getvalue()
-
-    def _validate_image(self, image_data: bytes) -> bool:
-        if len(image_data) > self.config.max_size:
-            raise ValueError(f"Image size exceeds {self.config.max_size} bytes")
-        try:
-            with Image.open(BytesIO(image_data)) as img:
-                img.verify()
-            return True
-        except Exception as e:
-            raise ValueError(f"Invalid image data: {e}")
-
 class DisplaySocketServer(ImageSocketBase):
     _instance = None
     _instance_lock = threading.Lock()  # For singleton pattern
@@ -80,12 +69,12 @@ class DisplaySocketServer(ImageSocketBase):
         # Initialize parent class
         ImageSocketBase.__init__(self, config)
 
-        # Create asyncio lock AFTER parent init
-        self._async_lock = asyncio.Lock()  # Rename to avoid confusion
-
         self._cleanup_socket()
         self.server = None
         self.current_image = None
+        self._frame_buf = bytearray()
+        # Complete response for the current frame, built once per frame change
+        self._response = None
         self._active_connections = set()
         self._initialized = True
         self.logger.info(f"Display socket server initialized (id={id(self)})")
@@ -119,19 +108,57 @@ class DisplaySocketServer(ImageSocketBase):
             raise
 
 
-    async def send_image(self, image: Image.Image) -> bool:
-        """Update the current image with debug logging"""
+    async def send_image(self, image: Image.Image, regions: Optional[List[Tuple[int, int, int, int]]] = None) -> bool:
+        """Update the current image with debug logging
+
+        regions lists the bounding boxes that changed since the previous frame;
+        an empty list means the frame is identical and the stored image is kept.
+        """
+        return await self.send_image_bytes(image.tobytes(), regions, image.size, image.mode)
+
+    async def send_image_bytes(self, frame, regions: Optional[List[Tuple[int, int, int, int]]] = None,
+                               size: Tuple[int, int] = (128, 64), mode: str = '1') -> bool:
+        """Update the current image from raw packed pixel data
+
+        The frame is copied into a buffer owned by the server, so the caller
+        can keep reusing its own buffer for the next frame.
+        """
         self.logger.info(f"Starting send_image for socket server (id={id(self)})")
 
+        if self.current_image is not None:
+            # Without dirty regions, compare the bytes; a 1 KiB memcmp is far
+            # cheaper than rebuilding the frame and response
+            if regions is None:
+                unchanged = (self._frame_buf == frame and self.current_image.size == size
+                             and self.current_image.mode == mode)
+            else:
+                unchanged = not regions
+            if unchanged:
+                self.logger.debug("Image unchanged, keeping current frame")
+                return True
+
+        # Validate everything that can fail before touching any state, so the
+        # stored image and the cached response always describe the same frame
         try:
-            async with self._async_lock:  # Use renamed lock
-                self.current_image = image
-                self.logger.info("Image updated in socket server")
-            return True
+            if mode not in IMAGE_MODES:
+                raise ValueError(f"unsupported image mode {mode!r}")
+            header = FRAME_HEADER.pack(len(frame), size[0], size[1], IMAGE_MODES.index(mode) + 1)
+            # Raises if the frame is too short for size and mode
+            Image.frombuffer(mode, size, frame, 'raw', mode, 0, 1)
         except Exception as e:
-            self.logger.error(f"Error in send_image: {e}", exc_info=True)
+            self.logger.error(f"Error in send_image: {e}")
             return False
 
+        # No lock needed: handlers run on the event loop thread and nothing
+        # below awaits, so clients never see a half-updated frame
+        if len(self._frame_buf) != len(frame):
+            self._frame_buf = bytearray(len(frame))
+        self._frame_buf[:] = frame
+        self.current_image = Image.frombuffer(mode, size, self._frame_buf, 'raw', mode, 0, 1)
+        self._response = header + self._frame_buf
+        self.logger.info("Image updated in socket server")
+        return True
+
     def _cleanup_socket(self) -> None:
         """Safely clean up the socket file"""
         try:
@@ -148,40 +175,9 @@ class DisplaySocketServer(ImageSocketBase):
         self._active_connections.add(client_id)
 
         try:
-            async with self._async_lock:  # Use async lock
-                self.logger.debug(f"Preparing response for client {client_id}")
-
-                # Create response
-                response = {}
-                if self.current_image:
-                    # Convert image to bytes in an executor to avoid blocking
-                    loop = asyncio.get_event_loop()
-                    compressed = await loop.run_in_executor(None, self._compress_image, self.current_image)
-
-                    response = {
-                        'status': 'success',
-                        'image': base64.b64encode(compressed).decode(),
-                        'metadata': {
-                            'size': len(compressed),
-                            'format': 'JPEG',
-                            'mode': self.current_image.mode
-                        }
-                    }
-                else:
-                    response = {
-                        'status': 'error',
-                        'message': 'No image available'
-                    }
-
-            # Convert response to bytes
-            msg = json.dumps(response).encode()
-
-            # Send length header
-            writer.write(len(msg).to_bytes(4, byteorder='big'))
-            await writer.drain()
-
-            # Send message
-            writer.write(msg)
+            # Every client between frame changes gets the same prebuilt bytes
+            response = self._response or NO_IMAGE_RESPONSE
+            writer.write(response)
             await writer.drain()
 
             self.logger.debug(f"Response sent to client {client_id}")
@@ -203,6 +199,7 @@ class DisplaySocketServer(ImageSocketBase):
                 self._cleanup_socket()
                 self.server = None
                 self.current_image = None
+                self._response = None
                 self.logger.info("Display socket server stopped")
 
     def __del__(self):
@@ -250,36 +247,36 @@ class DisplaySocketClient(ImageSocketBase):
                     self.logger.debug(f"Retrying after error: {last_error}")
                     last_error = None
 
-                with self._lock:
-                    try:
-                        # More generous timeouts
-                        connect_task = asyncio.open_unix_connection(path=self.config.socket_path)
-                        reader, writer = await asyncio.wait_for(connect_task, timeout=self.config.timeout)
-
-                        length_bytes = await reader.read(4)
-                        if not length_bytes:
-                            await asyncio.sleep(self.config.retry_delay)
-                            continue
-
-                        msg_length = int.from_bytes(length_bytes, byteorder='big')
-                        data = await reader.read(msg_length)
-
-                        response = json.loads(data.decode())
-                        if response['status'] != 'success':
-                            last_error = response.get('error', 'Unknown error')
-                            await asyncio.sleep(self.config.retry_delay)
-                            continue
+                try:
+                    # More generous timeouts
+                    connect_task = asyncio.open_unix_connection(path=self.config.socket_path)
+                    reader, writer = await asyncio.wait_for(connect_task, timeout=self.config.timeout)
 
-                        image_data = base64.b64decode(response['image'])
-                        self._validate_image(image_data)
+                    try:
+                        header = await reader.readexactly(FRAME_HEADER.size)
+                    except asyncio.IncompleteReadError:
+                        await asyncio.sleep(self.config.retry_delay)
+                        continue
 
-                        return True, Image.open(BytesIO(image_data)), None
+                    msg_length, width, height, mode_id = FRAME_HEADER.unpack(header)
+                    if msg_length > self.config.max_size:
+                        raise ValueError(f"Image size exceeds {self.config.max_size} bytes")
+                    data = await reader.readexactly(msg_length)
 
-                    except (asyncio.TimeoutError, ConnectionRefusedError) as e:
-                        last_error = str(e)
+                    if mode_id == NO_IMAGE:
+                        last_error = data.decode(errors='replace') or 'Unknown error'
                         await asyncio.sleep(self.config.retry_delay)
                         continue
 
+                    # Raises ValueError if the payload does not fill the image
+                    image = Image.frombytes(IMAGE_MODES[mode_id - 1], (width, height), data)
+                    return True, image, None
+
+                except (asyncio.TimeoutError, ConnectionRefusedError) as e:
+                    last_error = str(e)
+                    await asyncio.sleep(self.config.retry_delay)
+                    continue
+
             except Exception as e:
                 last_error = str(e)
                 await asyncio.sleep(self.config.retry_delay)
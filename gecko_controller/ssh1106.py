@@ -1,17 +1,23 @@
 import os
 import time
+import fcntl
+import struct
 import subprocess
 import smbus2
-from PIL import Image
+from PIL import Image, ImageDraw
 import threading
 from typing import Optional
 
+# I2C timing values (100ms timeout)
+I2C_TIMEOUT = 0x0702  # I2C timeout value define
+I2C_TIMEOUT_VALUE = struct.pack('I', 100)  # 100 milliseconds
+
 class SSH1106Display:
     """
     Singleton implementation of SSH1106 OLED display driver with resilient I2C handling.
     """
     _instance = None
-    _lock = threading.Lock()
+    _lock = threading.RLock()  # show_image holds it across write_pages
 
     def __new__(cls, *args, **kwargs):
         with cls._lock:
@@ -28,34 +34,58 @@ class SSH1106Display:
             self.pages = 8
             self.width = 128
             self.height = 64
+            # Packed bytes last written to the panel; None forces a full write
+            self._prev_packed = None
+            # Full 132x64 controller RAM image, reused for every frame
+            self._full_image = Image.new('1', (132, 64), 255)
+            self._full_draw = ImageDraw.Draw(self._full_image)
+            # Page select + column 2 commands never change, so build them once.
+            # Column 2 is the start address the driver has always used.
+            self._page_cmd_msgs = [
+                smbus2.i2c_msg.write(self.addr, [0x00, 0xB0 + page, 0x02, 0x10])
+                for page in range(self.pages)
+            ]
             try:
                 self.bus = smbus2.SMBus(1)
                 self._initialized = True
             except Exception as e:
                 print(f"Failed to initialize I2C bus: {e}")
                 self._initialized = False
+                return
 
-    def write_cmd(self, cmd: int, retries: int = 3) -> bool:
+            try:
+                # Lower-level transfer timeout, set once for the bus fd
+                fcntl.ioctl(self.bus.fd, I2C_TIMEOUT, I2C_TIMEOUT_VALUE)
+            except OSError as e:
+                print(f"Could not set I2C timeout: {e}")
+
+    def write_pages(self, pages, packed: bytes, retries: int = 3) -> bool:
+        """Write whole pages of display RAM in a single I2C_RDWR transfer
+
+        Each page gets a command message selecting the page and column 2,
+        then one data message with the 130 column bytes that fit from there
+        to the end of RAM, instead of a separate SMBus transaction per
+        command and per 32-byte block.
+        """
         if not self._initialized:
             return False
 
+        msgs = []
+        for page in pages:
+            msgs.append(self._page_cmd_msgs[page])
+            data = packed[page:130 * self.pages:self.pages]
+            msgs.append(smbus2.i2c_msg.write(self.addr, b'\x40' + data))
+        if not msgs:
+            return True
+
         for attempt in range(retries):
             try:
                 with self._lock:
-                    # Set a lower-level timeout using fcntl
-                    import fcntl
-                    import struct
-                    # I2C timing values (100ms timeout)
-                    I2C_TIMEOUT = 0x0702  # I2C timeout value define
-                    I2C_TIMEOUT_VALUE = struct.pack('I', 100)  # 100 milliseconds
-                    fcntl.ioctl(self.bus.fd, I2C_TIMEOUT, I2C_TIMEOUT_VALUE)
-
-                    self.bus.write_byte_data(self.addr, 0x00, cmd)
-                    time.sleep(0.001)  # 1ms delay between commands
+                    self.bus.i2c_rdwr(*msgs)
                     return True
             except Exception as e:
                 if attempt == retries - 1:
-                    print(f"Error in write_cmd (attempt {attempt + 1}/{retries}): {e}")
+                    print(f"Error in write_pages (attempt {attempt + 1}/{retries}): {e}")
                 time.sleep(0.01)  # Short delay before retry
         return False
 
@@ -67,8 +97,14 @@ class SSH1106Display:
             except:
                 pass
 
-    def show_image(self, image: Image.Image) -> bool:
-        """Display a PIL Image object with thread safety and error handling"""
+    def show_image(self, image: Image.Image, regions=None, force_full_refresh: bool = False) -> bool:
+        """Display a PIL Image object with thread safety and error handling
+
+        Only pages whose bytes differ from the last frame written are sent.
+        If regions is given as a list of (x0, y0, x1, y1) boxes, only the
+        8-row pages they touch are considered. force_full_refresh rewrites
+        every page, e.g. after the panel was reset.
+        """
         if not self._initialized:
             return False
 
@@ -78,34 +114,49 @@ class SSH1106Display:
                 if image.mode != '1':
                     image = image.convert('1')
 
-                # Create a new image with the full 132x64 size
-                full_image = Image.new('1', (132, 64), 255)  # white background
+                # Clear the pooled 132x64 image to the white background
+                full_image = self._full_image
+                self._full_draw.rectangle((0, 0, 131, 63), fill=255)
 
                 # Paste the image in the center
                 paste_x = (132 - image.width) // 2
                 paste_y = (64 - image.height) // 2
                 full_image.paste(image, (paste_x, paste_y))
 
-                # Reset the display position
-                if not (self.write_cmd(0x02) and self.write_cmd(0x10)):
+                if regions is None:
+                    pages = range(self.pages)
+                else:
+                    pages = sorted({
+                        page
+                        for _, y0, _, y1 in regions
+                        for page in range(max(0, y0 // 8), min(self.pages, (y1 + 7) // 8))
+                    })
+
+                # Pack to the controller's layout in C: after a transpose each
+                # column is a row, and '1;IR' packs it LSB-first with black as 1,
+                # so byte x*8 + page holds the 8 vertical pixels of that page
+                packed = full_image.transpose(Image.TRANSPOSE).tobytes('raw', '1;IR')
+
+                prev = None if force_full_refresh else self._prev_packed
+                if prev is None:
+                    # Panel contents unknown, so every page has to be written
+                    pages = range(self.pages)
+                else:
+                    # Skip pages whose bytes match what the panel already shows
+                    pages = [
+                        page for page in pages
+                        if packed[page::self.pages] != prev[page::self.pages]
+                    ]
+
+                if not self.write_pages(pages, packed):
+                    self._prev_packed = None
                     return False
 
-                # Write display buffer one page at a time
-                for page in range(self.pages):
-                    if not self.write_cmd(0xB0 + page):
-                        return False
-
-                    for x in range(132):
-                        bits = 0
-                        for bit in range(8):
-                            y = page * 8 + bit
-                            if y < 64 and x < 132:
-                                if full_image.getpixel((x, y)) == 0:
-                                    bits |= (1 << bit)
-
-                        if not self.write_data(bits):
-                            return False
-
+                if prev is None:
+                    self._prev_packed = bytearray(packed)
+                else:
+                    for page in pages:
+                        prev[page::self.pages] = packed[page::self.pages]
                 return True
 
         except Exception as e:
@@ -1,6 +1,7 @@
 import pytest
+import logging.handlers
 from datetime import datetime, time
-from gecko_controller.controller import GeckoController
+from gecko_controller.controller import GeckoController, BatchedReadingsLog
 
 def test_parse_time_setting():
     """Test the time parsing utility function"""
@@ -74,3 +75,59 @@ def test_uv_correction_calculation():
     # Direct angle should need less correction than oblique angle
     assert direct_correction < oblique_correction, \
         "Direct measurements should need less correction than oblique ones"
+
+def test_light_period_boundaries():
+    """Test the cached light period check at the schedule edges"""
+    controller = GeckoController(test_mode=True)
+    controller.light_on_time = time(7, 30)
+    controller.light_off_time = time(19, 30)
+
+    assert not controller.is_light_period(time(7, 29, 59))
+    assert controller.is_light_period(time(7, 30))
+    assert controller.is_light_period(time(19, 29, 59))
+    assert not controller.is_light_period(time(19, 30))
+
+    # Cached answer must not leak across minutes
+    assert controller.is_light_period(time(12, 0))
+    assert not controller.is_light_period(time(23, 0))
+
+def test_smooth_temp():
+    """Test the temperature ring averages only the samples it holds"""
+    controller = GeckoController(test_mode=True)
+    assert controller.smooth_temp(None) is None
+    assert controller.smooth_temp(20.0) == 20.0
+    assert controller.smooth_temp(22.0) == 21.0
+
+    # Once full, the oldest readings drop out
+    for _ in range(8):
+        result = controller.smooth_temp(30.0)
+    assert result == 30.0
+
+def test_format_readings_row():
+    """Test the readings CSV row matches the layout the web app parses"""
+    row = GeckoController.format_readings_row(
+        datetime(2024, 3, 1, 14, 5, 9, 123456),
+        25.04, None, 60.5, 3.25, 0.0, True, False
+    )
+    assert row == "2024-03-01 14:05:09,123,25.0,-1.0,60.5000,3.2500,0.0000,1,0\n"
+
+def test_readings_log_rollover(tmp_path):
+    """Test batches keep being written across a rotation of the readings file"""
+    log_file = tmp_path / "readings.csv"
+    handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=100, backupCount=2, delay=True
+    )
+    readings_log = BatchedReadingsLog(handler)
+    row = "2024-03-01 14:05:09,123,25.0,60.0,1.0000,2.0000,3.0000,1,0\n"
+
+    for _ in range(4):
+        assert readings_log.write_batch([row])
+
+    assert log_file.read_text() == row
+    assert (tmp_path / "readings.csv.1").read_text() == row
+    handler.close()
+
+    # A file error drops the batch instead of raising
+    handler.baseFilename = str(tmp_path / "missing" / "readings.csv")
+    handler.stream = None
+    assert not readings_log.write_batch([row])